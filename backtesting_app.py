@@ -3,7 +3,8 @@ import numpy as np
 
 # Data fetching
 import yfinance as yf
-from main_backtesting_engine import BacktestingEngine
+from main_backtesting_engine import BacktestingEngine, fetch_many
+from downsample import lttb
 
 
 # Date and time handling
@@ -20,6 +21,7 @@ import seaborn as sns
 import streamlit as st
 
 # System and utility
+from concurrent.futures import ThreadPoolExecutor
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -28,6 +30,25 @@ from scipy import stats
 
 # For additional analysis (optional)
 from sklearn.metrics import mean_squared_error
+
+# Tickers whose price history is prefetched in the background on app start
+POPULAR_TICKERS = ('AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'NVDA', 'TSLA',
+                   'JPM', 'V', 'JNJ', 'WMT', 'PG', 'SPY', 'QQQ')
+
+# Ways of combining the enabled indicator conditions
+STRATEGY_LOGIC_OPTIONS = ('AND', 'OR')
+
+# Line traces longer than this are downsampled to PLOT_POINTS before plotting
+DOWNSAMPLE_THRESHOLD = 3000
+PLOT_POINTS = 2000
+
+def prefetch_popular_tickers(start_date, end_date):
+    """Warm the price cache for popular tickers without blocking the UI"""
+    executor = ThreadPoolExecutor(max_workers=1)
+    executor.submit(fetch_many, POPULAR_TICKERS, start_date, end_date)
+    # Don't wait on the download; it only needs to land in the cache
+    executor.shutdown(wait=False)
+
 def create_dashboard():
     """Create Streamlit dashboard interface"""
     st.set_page_config(page_title="Trading Strategy Backtester", layout="wide")
@@ -47,6 +68,11 @@ def create_dashboard():
     with col2:
         end_date = st.date_input("End Date", value=datetime.now())
     
+    # Prefetch once per session so the first backtest hits a warm cache
+    if not st.session_state.get('prefetched'):
+        prefetch_popular_tickers(start_date, end_date)
+        st.session_state.prefetched = True
+    
     initial_capital = st.sidebar.number_input("Initial Capital", value=100000, min_value=1000)
     
     # Technical indicator settings
@@ -62,7 +88,7 @@ def create_dashboard():
     use_macd = st.sidebar.checkbox("Use MACD", value=True)
     use_ma = st.sidebar.checkbox("Use Moving Average", value=False)
     
-    logic = st.sidebar.selectbox("Strategy Logic", ["AND", "OR"])
+    logic = st.sidebar.selectbox("Strategy Logic", STRATEGY_LOGIC_OPTIONS)
     
     # Run backtest button
     if st.sidebar.button("🎯 Run Backtest"):
@@ -124,11 +150,39 @@ def display_results(engine):
     # Export options
     create_export_options(engine, metrics)
 
+def downsample(x, y):
+    """Downsample a long line trace with LTTB so the browser only renders what is visible"""
+    if len(x) > DOWNSAMPLE_THRESHOLD:
+        return lttb(x, y, PLOT_POINTS)
+    return x, y
+
 def create_interactive_charts(engine):
     """Create interactive Plotly charts"""
     
     st.header("📈 Interactive Charts")
     
+    # Hand Plotly plain ndarrays so it can serialize them as typed buffers.
+    # Dropping the timezone keeps wall-clock datetime64 values instead of an object array.
+    x = engine.data.index.tz_localize(None).to_numpy()
+    close = engine.data['Close'].to_numpy()
+    portfolio_value = engine.data['Portfolio_Value'].to_numpy()
+    rsi = engine.data['RSI'].to_numpy()
+    macd = engine.data['MACD'].to_numpy()
+    macd_signal = engine.data['MACD_Signal'].to_numpy()
+    
+    # Signal bar positions, found once without building filtered DataFrames
+    signals = engine.data['Signal'].to_numpy()
+    buy_idx = np.flatnonzero(signals == 1)
+    sell_idx = np.flatnonzero(signals == -1)
+    
+    # Line traces are downsampled; signal markers stay at full resolution.
+    # All traces use Scattergl so the browser renders them with WebGL rather than SVG.
+    close_x, close_y = downsample(x, close)
+    portfolio_x, portfolio_y = downsample(x, portfolio_value)
+    rsi_x, rsi_y = downsample(x, rsi)
+    macd_x, macd_y = downsample(x, macd)
+    macd_signal_x, macd_signal_y = downsample(x, macd_signal)
+    
     # Create subplots
     fig = make_subplots(
         rows=4, cols=1,
@@ -140,42 +194,40 @@ def create_interactive_charts(engine):
     
     # Price chart with buy/sell signals
     fig.add_trace(
-        go.Scatter(x=engine.data.index, y=engine.data['Close'], 
-                  name='Close Price', line=dict(color='blue')),
+        go.Scattergl(x=close_x, y=close_y, 
+                    name='Close Price', line=dict(color='blue')),
         row=1, col=1
     )
     
     # Buy signals
-    buy_signals = engine.data[engine.data['Signal'] == 1]
-    if not buy_signals.empty:
+    if len(buy_idx) > 0:
         fig.add_trace(
-            go.Scatter(x=buy_signals.index, y=buy_signals['Close'],
-                      mode='markers', name='Buy Signal',
-                      marker=dict(color='green', size=10, symbol='triangle-up')),
+            go.Scattergl(x=x[buy_idx], y=close[buy_idx],
+                        mode='markers', name='Buy Signal',
+                        marker=dict(color='green', size=10, symbol='triangle-up')),
             row=1, col=1
         )
     
     # Sell signals
-    sell_signals = engine.data[engine.data['Signal'] == -1]
-    if not sell_signals.empty:
+    if len(sell_idx) > 0:
         fig.add_trace(
-            go.Scatter(x=sell_signals.index, y=sell_signals['Close'],
-                      mode='markers', name='Sell Signal',
-                      marker=dict(color='red', size=10, symbol='triangle-down')),
+            go.Scattergl(x=x[sell_idx], y=close[sell_idx],
+                        mode='markers', name='Sell Signal',
+                        marker=dict(color='red', size=10, symbol='triangle-down')),
             row=1, col=1
         )
     
     # Portfolio value
     fig.add_trace(
-        go.Scatter(x=engine.data.index, y=engine.data['Portfolio_Value'],
-                  name='Portfolio Value', line=dict(color='purple')),
+        go.Scattergl(x=portfolio_x, y=portfolio_y,
+                    name='Portfolio Value', line=dict(color='purple')),
         row=2, col=1
     )
     
     # RSI
     fig.add_trace(
-        go.Scatter(x=engine.data.index, y=engine.data['RSI'],
-                  name='RSI', line=dict(color='orange')),
+        go.Scattergl(x=rsi_x, y=rsi_y,
+                    name='RSI', line=dict(color='orange')),
         row=3, col=1
     )
     
@@ -185,14 +237,14 @@ def create_interactive_charts(engine):
     
     # MACD
     fig.add_trace(
-        go.Scatter(x=engine.data.index, y=engine.data['MACD'],
-                  name='MACD', line=dict(color='blue')),
+        go.Scattergl(x=macd_x, y=macd_y,
+                    name='MACD', line=dict(color='blue')),
         row=4, col=1
     )
     
     fig.add_trace(
-        go.Scatter(x=engine.data.index, y=engine.data['MACD_Signal'],
-                  name='MACD Signal', line=dict(color='red')),
+        go.Scattergl(x=macd_signal_x, y=macd_signal_y,
+                    name='MACD Signal', line=dict(color='red')),
         row=4, col=1
     )
     
@@ -210,9 +262,9 @@ def display_trade_log(engine):
     
     st.header("📋 Trade Log")
     
-    if engine.trades:
-        trades_df = pd.DataFrame(engine.trades)
-        trades_df['Date'] = pd.to_datetime(trades_df['Date']).dt.strftime('%Y-%m-%d')
+    if not engine.trades_df.empty:
+        trades_df = engine.trades_df.copy()
+        trades_df['Date'] = trades_df['Date'].dt.strftime('%Y-%m-%d')
         st.dataframe(trades_df, use_container_width=True)
     else:
         st.info("No trades executed with current strategy parameters")
@@ -238,9 +290,8 @@ def create_export_options(engine, metrics):
     
     with col2:
         if st.button("📈 Download Trade Log (CSV)"):
-            if engine.trades:
-                trades_df = pd.DataFrame(engine.trades)
-                csv_data = trades_df.to_csv(index=False)
+            if not engine.trades_df.empty:
+                csv_data = engine.trades_df.to_csv(index=False)
                 st.download_button(
                     label="Download Trade Log",
                     data=csv_data,
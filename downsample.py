@@ -0,0 +1,39 @@
+import numpy as np
+
+
+def lttb(x, y, n_out):
+    """Downsample a series to n_out points with Largest-Triangle-Three-Buckets"""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    # Work on numeric x so datetime axes can be used in the area computation
+    if np.issubdtype(x.dtype, np.datetime64):
+        xs = x.astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+    else:
+        xs = x.astype(np.float64)
+    ys = y.astype(np.float64)
+
+    # First and last points are always kept; the rest are split into n_out - 2 buckets
+    every = (n - 2) / (n_out - 2)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    a = 0
+
+    for i in range(n_out - 2):
+        # Average of the next bucket is the third vertex of the triangle
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = xs[avg_start:avg_end].mean()
+        avg_y = ys[avg_start:avg_end].mean()
+
+        # Keep the point in the current bucket forming the largest triangle
+        range_start = int(i * every) + 1
+        range_end = int((i + 1) * every) + 1
+        areas = np.abs((xs[a] - avg_x) * (ys[range_start:range_end] - ys[a]) -
+                       (xs[a] - xs[range_start:range_end]) * (avg_y - ys[a]))
+        a = range_start + int(np.argmax(np.nan_to_num(areas, nan=-1.0)))
+        selected[i + 1] = a
+
+    selected[-1] = n - 1
+    return x[selected], y[selected]
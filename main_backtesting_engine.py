@@ -6,44 +6,471 @@ import plotly.subplots as sp
 from plotly.subplots import make_subplots
 import streamlit as st
 from datetime import datetime, timedelta
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba is optional; without it the kernels below run as plain Python
+    prange = range
+    
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+try:
+    import talib
+except ImportError:
+    # TA-Lib needs its C library; without it the NumPy/pandas implementations are used
+    talib = None
+import pyarrow.parquet as pq
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import hashlib
+import os
+import tempfile
+import threading
 import warnings
 warnings.filterwarnings('ignore')
 
+# On-disk cache for downloaded price history, keyed by (ticker, start, end)
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'backtester')
+
+# OHLC columns stored as float32 after download
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close']
+
+# Indicator columns added by calculate_indicators, stored as float32 like the prices
+INDICATOR_COLUMNS = ['RSI', 'MACD', 'MACD_Signal', 'MACD_Histogram', 'MA_20', 'MA_50',
+                     'BB_Upper', 'BB_Middle', 'BB_Lower']
+
+# Most entries kept in each in-process Streamlit cache before the least recently used is evicted
+CACHE_MAX_ENTRIES = 32
+
+# Indicator columns consumed by the signal state machine
+SIGNAL_INPUTS = ['RSI', 'MACD', 'MACD_Signal', 'Close', 'MA_20']
+
+# Trade log columns; Cost is set on BUYs and Revenue on SELLs, the other is NaN
+TRADE_COLUMNS = ['Date', 'Action', 'Price', 'Shares', 'Cost', 'Cash', 'Total_Shares', 'Revenue']
+
+# Metrics produced for each parameter set by BacktestingEngine.grid_search
+GRID_METRICS = ['Cumulative Return (%)', 'Sharpe Ratio', 'Max Drawdown (%)',
+                'Total Trades', 'Volatility (%)', 'Final Portfolio Value']
+
+def _cache_key(ticker, start_date, end_date):
+    """Canonical (ticker, start, end) strings, so equivalent requests share one cache entry"""
+    return (ticker.strip().upper(),
+            pd.Timestamp(start_date).date().isoformat(),
+            pd.Timestamp(end_date).date().isoformat())
+
+def _cache_path(ticker, start_date, end_date):
+    """Return the Parquet file path used to cache a (ticker, start, end) download"""
+    key = f"{ticker}|{start_date}|{end_date}"
+    return os.path.join(CACHE_DIR, hashlib.sha1(key.encode()).hexdigest() + '.parquet')
+
+# Per-path locks so the background prefetch and a foreground load never write one cache file at once
+_cache_locks = {}
+_cache_locks_guard = threading.Lock()
+
+def _cache_lock(path):
+    """Return the lock that serializes downloading and writing one cache file in this process"""
+    with _cache_locks_guard:
+        return _cache_locks.setdefault(path, threading.Lock())
+
+def _store_price_history(data, path):
+    """Downcast a downloaded OHLCV frame and write it to the Parquet cache"""
+    # Prices don't need float64 resolution; halving the width halves the bytes cached and scanned
+    for column in PRICE_COLUMNS:
+        data[column] = data[column].astype(np.float32)
+    data['Volume'] = pd.to_numeric(data['Volume'], downcast='integer')
+    
+    if not data.empty:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write to a temporary file and rename it into place, so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        os.close(fd)
+        try:
+            data.to_parquet(tmp_path, compression='zstd')
+            os.replace(tmp_path, path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+    return data
+
+@st.cache_data(ttl=3600, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _load_price_history(ticker, start_date, end_date, columns=None):
+    """Load price history from the Parquet cache, downloading it on a miss (memoized by Streamlit)"""
+    path = _cache_path(ticker, start_date, end_date)
+    with _cache_lock(path):
+        if os.path.exists(path):
+            try:
+                # Only the requested columns are read from disk
+                return pq.read_table(path, columns=columns, use_pandas_metadata=True).to_pandas()
+            except (OSError, ValueError):
+                # An unreadable cache file is dropped and downloaded again
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+        
+        stock = yf.Ticker(ticker)
+        data = _store_price_history(stock.history(start=start_date, end=end_date), path)
+    return data[columns] if columns is not None else data
+
+def fetch_many(tickers, start_date, end_date):
+    """Download several tickers in one batched request and store each in the Parquet cache"""
+    _, start_date, end_date = _cache_key('', start_date, end_date)
+    tickers = [ticker.strip().upper() for ticker in tickers]
+    missing = [t for t in tickers if not os.path.exists(_cache_path(t, start_date, end_date))]
+    if not missing:
+        return
+    
+    # Match Ticker.history's defaults (adjusted prices, actions, exchange timezone)
+    # so batched and single downloads produce interchangeable cache entries
+    data = yf.download(' '.join(missing), start=start_date, end=end_date, group_by='ticker',
+                       threads=True, auto_adjust=True, actions=True, ignore_tz=False, progress=False)
+    
+    for ticker in missing:
+        frame = data[ticker] if isinstance(data.columns, pd.MultiIndex) else data
+        frame = frame.dropna(how='all')
+        path = _cache_path(ticker, start_date, end_date)
+        # A foreground load may have cached this ticker while the batch was downloading
+        with _cache_lock(path):
+            if not frame.empty and not os.path.exists(path):
+                _store_price_history(frame.copy(), path)
+
+@njit(cache=True)
+def _ema(x, alpha):
+    """Exponential moving average by direct recursion, equivalent to ewm(alpha=alpha, adjust=False)"""
+    out = np.empty_like(x)
+    average = np.nan
+    skipped = 0
+    for i in range(len(x)):
+        if np.isnan(x[i]):
+            # Missing values hold the previous average, as pandas ewm does
+            skipped += 1
+        elif np.isnan(average):
+            average = x[i]
+            skipped = 0
+        elif skipped == 0:
+            average = alpha * x[i] + (1 - alpha) * average
+        else:
+            # Like ewm's default ignore_na=False, the old average keeps decaying across the gap
+            old_weight = (1 - alpha) ** (skipped + 1)
+            average = (old_weight * average + alpha * x[i]) / (old_weight + alpha)
+            skipped = 0
+        out[i] = average
+    return out
+
+@njit(cache=True)
+def _wilder_average(x, window):
+    """Wilder's smoothed average of x[1:], seeded with the simple mean of its first window valid values"""
+    out = np.full(len(x), np.nan)
+    
+    # Find the bar where x[1:] has seen window valid values
+    count = 0
+    end = 1
+    while end < len(x) and count < window:
+        if not np.isnan(x[end]):
+            count += 1
+        end += 1
+    if count < window:
+        return out
+    
+    seed = x[1:end]
+    out[end - 1] = seed[~np.isnan(seed)].mean()
+    for i in range(end, len(x)):
+        if np.isnan(x[i]):
+            # A missing value holds the prior average instead of poisoning every later bar
+            out[i] = out[i - 1]
+        else:
+            out[i] = (out[i - 1] * (window - 1) + x[i]) / window
+    return out
+
+@njit(cache=True)
+def _rolling_mean_std(x, window):
+    """Rolling mean and sample std of x in one pass with running sums (compiled with Numba)"""
+    n = len(x)
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    if n == 0:
+        return mean, std
+    
+    # Sums are taken around the first value to limit cancellation in the sum of squares
+    shift = x[0] if not np.isnan(x[0]) else 0.0
+    total = 0.0
+    total_sq = 0.0
+    nan_count = 0
+    for i in range(n):
+        if np.isnan(x[i]):
+            nan_count += 1
+        else:
+            d = x[i] - shift
+            total += d
+            total_sq += d * d
+        if i >= window:
+            if np.isnan(x[i - window]):
+                nan_count -= 1
+            else:
+                d = x[i - window] - shift
+                total -= d
+                total_sq -= d * d
+        # Like pandas, a window with any missing value has no result
+        if i >= window - 1 and nan_count == 0:
+            m = total / window
+            mean[i] = m + shift
+            if window > 1:
+                std[i] = np.sqrt(max((total_sq - total * m) / (window - 1), 0.0))
+    return mean, std
+
+def _use_talib(values):
+    """Whether TA-Lib should compute an indicator for values"""
+    # TA-Lib doesn't skip NaN (RSI sticks at 0 and SMA at NaN afterwards), so gappy input
+    # goes to the NumPy path, which handles it and otherwise gives the same values
+    return talib is not None and not np.isnan(values).any()
+
 class TechnicalIndicators:
     """Class to calculate various technical indicators"""
     
     @staticmethod
     def rsi(prices, window=14):
-        """Calculate Relative Strength Index"""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
-        rs = gain / loss
-        return 100 - (100 / (1 + rs))
+        """Calculate Relative Strength Index using Wilder's smoothing"""
+        values = prices.to_numpy(dtype=np.float64)
+        if _use_talib(values):
+            return pd.Series(talib.RSI(values, timeperiod=window), index=prices.index)
+        
+        delta = np.zeros_like(values)
+        np.subtract(values[1:], values[:-1], out=delta[1:])
+        gain = np.maximum(delta, 0.0)
+        loss = np.maximum(-delta, 0.0)
+        avg_gain = _wilder_average(gain, window)
+        avg_loss = _wilder_average(loss, window)
+        # A window without losses gives rs = inf and therefore RSI = 100
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = avg_gain / avg_loss
+        rsi = 100 - (100 / (1 + rs))
+        # A flat window (no gains or losses) is 0, as in TA-Lib
+        rsi[(avg_gain == 0) & (avg_loss == 0)] = 0.0
+        return pd.Series(rsi, index=prices.index)
     
     @staticmethod
     def macd(prices, fast=12, slow=26, signal=9):
         """Calculate MACD, MACD Signal, and MACD Histogram"""
-        ema_fast = prices.ewm(span=fast).mean()
-        ema_slow = prices.ewm(span=slow).mean()
+        values = prices.to_numpy(dtype=np.float64)
+        ema_fast = _ema(values, 2 / (fast + 1))
+        ema_slow = _ema(values, 2 / (slow + 1))
         macd_line = ema_fast - ema_slow
-        signal_line = macd_line.ewm(span=signal).mean()
+        signal_line = _ema(macd_line, 2 / (signal + 1))
         histogram = macd_line - signal_line
-        return macd_line, signal_line, histogram
+        return (pd.Series(macd_line, index=prices.index),
+                pd.Series(signal_line, index=prices.index),
+                pd.Series(histogram, index=prices.index))
     
     @staticmethod
     def moving_average(prices, window):
         """Calculate Simple Moving Average"""
+        values = prices.to_numpy(dtype=np.float64)
+        if _use_talib(values):
+            return pd.Series(talib.SMA(values, timeperiod=window), index=prices.index)
         return prices.rolling(window=window).mean()
     
     @staticmethod
     def bollinger_bands(prices, window=20, num_std=2):
         """Calculate Bollinger Bands"""
-        sma = prices.rolling(window=window).mean()
-        std = prices.rolling(window=window).std()
+        sma, std = _rolling_mean_std(prices.to_numpy(dtype=np.float64), window)
         upper_band = sma + (std * num_std)
         lower_band = sma - (std * num_std)
-        return upper_band, sma, lower_band
+        return (pd.Series(upper_band, index=prices.index),
+                pd.Series(sma, index=prices.index),
+                pd.Series(lower_band, index=prices.index))
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _compute_indicators(close):
+    """Compute the INDICATOR_COLUMNS arrays from a close price array (memoized by Streamlit)"""
+    prices = pd.Series(close, dtype=np.float64)
+    macd, signal, histogram = TechnicalIndicators.macd(prices)
+    upper, middle, lower = TechnicalIndicators.bollinger_bands(prices)
+    indicators = {
+        'RSI': TechnicalIndicators.rsi(prices),
+        'MACD': macd,
+        'MACD_Signal': signal,
+        'MACD_Histogram': histogram,
+        # The 20-bar Bollinger middle band is the 20-bar moving average
+        'MA_20': middle,
+        'MA_50': TechnicalIndicators.moving_average(prices, 50),
+        'BB_Upper': upper,
+        'BB_Middle': middle,
+        'BB_Lower': lower
+    }
+    # Indicators are computed in float64 but stored as float32 to halve what the signal pass reads
+    return {column: indicators[column].to_numpy(dtype=np.float32) for column in INDICATOR_COLUMNS}
+
+@njit(cache=True)
+def _resolve_signals(buy_condition, sell_condition):
+    """Turn buy/sell condition masks into position-aware signals (compiled with Numba)"""
+    # Signals only take the values -1, 0 and 1, so one byte per bar is enough
+    signal = np.zeros(len(buy_condition), dtype=np.int8)
+    current_position = 0
+    
+    # Buys only fire when flat and sells only when holding, so walk just the candidate bars.
+    # A bar meeting both conditions flips the position either way.
+    for i in np.flatnonzero(buy_condition | sell_condition):
+        if buy_condition[i] and current_position == 0:
+            signal[i] = 1  # Buy signal
+            current_position = 1
+        elif sell_condition[i] and current_position == 1:
+            signal[i] = -1  # Sell signal
+            current_position = 0
+    
+    return signal
+
+def _build_signals(indicators, strategy_params):
+    """Compute the Signal array from a dict of SIGNAL_INPUTS arrays"""
+    rsi = indicators['RSI']
+    macd = indicators['MACD']
+    macd_signal = indicators['MACD_Signal']
+    close = indicators['Close']
+    ma_20 = indicators['MA_20']
+    n = len(close)
+    
+    # (buy, sell) condition masks for each enabled indicator, evaluated over all bars at once
+    conditions = []
+    
+    # RSI conditions
+    if strategy_params['use_rsi']:
+        conditions.append((rsi < strategy_params['rsi_buy_threshold'],
+                           rsi > strategy_params['rsi_sell_threshold']))
+    
+    # MACD conditions
+    if strategy_params['use_macd']:
+        macd_crossover = np.zeros(n, dtype=bool)
+        macd_crossunder = np.zeros(n, dtype=bool)
+        macd_crossover[1:] = (macd[1:] > macd_signal[1:]) & (macd[:-1] <= macd_signal[:-1])
+        macd_crossunder[1:] = (macd[1:] < macd_signal[1:]) & (macd[:-1] >= macd_signal[:-1])
+        conditions.append((macd_crossover, macd_crossunder))
+    
+    # Moving Average conditions
+    if strategy_params['use_ma']:
+        conditions.append((close > ma_20, close < ma_20))
+    
+    # Combine conditions based on strategy logic; sells always trigger on any condition
+    buy_condition = np.full(n, strategy_params['logic'] == 'AND')
+    sell_condition = np.zeros(n, dtype=bool)
+    for buy, sell in conditions:
+        if strategy_params['logic'] == 'AND':
+            buy_condition &= buy
+        else:  # OR logic
+            buy_condition |= buy
+        sell_condition |= sell
+    
+    # The first bar has no previous position to act on
+    buy_condition[:1] = False
+    sell_condition[:1] = False
+    
+    return _resolve_signals(buy_condition, sell_condition)
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _generate_signals(indicators, strategy_params):
+    """_build_signals memoized by Streamlit, for dashboard reruns with unchanged parameters"""
+    return _build_signals(indicators, strategy_params)
+
+@njit(cache=True)
+def _simulate_trades(close, signals, initial_capital):
+    """Run the buy/sell state machine over raw arrays and return the trade records (compiled with Numba)"""
+    # State only changes on signal bars, so walk those alone; their count also bounds the trade buffers
+    signal_bars = np.flatnonzero(signals)
+    max_trades = len(signal_bars)
+    trade_idx = np.empty(max_trades, dtype=np.int64)
+    trade_action = np.empty(max_trades, dtype=np.int8)
+    trade_shares = np.empty(max_trades, dtype=np.int64)
+    trade_value = np.empty(max_trades, dtype=np.float64)
+    trade_cash = np.empty(max_trades, dtype=np.float64)
+    trade_total_shares = np.empty(max_trades, dtype=np.int64)
+    
+    cash = float(initial_capital)
+    shares = 0
+    k = 0
+    
+    for i in signal_bars:
+        current_price = close[i]
+        signal = signals[i]
+        
+        if signal == 1 and cash > 0:  # Buy
+            shares_to_buy = int(cash / current_price)
+            if shares_to_buy > 0:
+                cost = shares_to_buy * current_price
+                cash -= cost
+                shares += shares_to_buy
+                
+                trade_idx[k] = i
+                trade_action[k] = 1
+                trade_shares[k] = shares_to_buy
+                trade_value[k] = cost
+                trade_cash[k] = cash
+                trade_total_shares[k] = shares
+                k += 1
+        
+        elif signal == -1 and shares > 0:  # Sell
+            revenue = shares * current_price
+            cash += revenue
+            
+            trade_idx[k] = i
+            trade_action[k] = -1
+            trade_shares[k] = shares
+            trade_value[k] = revenue
+            trade_cash[k] = cash
+            trade_total_shares[k] = 0
+            k += 1
+            shares = 0
+    
+    return (trade_idx[:k], trade_action[:k], trade_shares[:k],
+            trade_value[:k], trade_cash[:k], trade_total_shares[:k])
+
+@njit(parallel=True, cache=True)
+def _batch_simulate(close, signal_matrix, initial_capital):
+    """Simulate one signal row per parameter set in parallel and return a GRID_METRICS row for each"""
+    n_params, n = signal_matrix.shape
+    metrics = np.zeros((n_params, 6))
+    if n == 0:
+        return metrics
+    risk_free_rate = 0.02 / 252
+    
+    for p in prange(n_params):
+        trade_idx, _, _, _, trade_cash, trade_total_shares = _simulate_trades(close, signal_matrix[p], initial_capital)
+        
+        # Replay the trades to get the portfolio value at every bar
+        portfolio_value = np.empty(n)
+        cash = float(initial_capital)
+        shares = 0
+        k = 0
+        for i in range(n):
+            if k < len(trade_idx) and trade_idx[k] == i:
+                cash = trade_cash[k]
+                shares = trade_total_shares[k]
+                k += 1
+            portfolio_value[i] = cash + shares * close[i]
+        
+        # Same formulas as calculate_performance_metrics
+        sharpe_ratio = 0.0
+        volatility = 0.0
+        if n > 2:
+            returns = portfolio_value[1:] / portfolio_value[:-1] - 1
+            mean_return = returns.mean()
+            std = np.sqrt(((returns - mean_return) ** 2).sum() / (len(returns) - 1))
+            if std != 0:
+                sharpe_ratio = np.sqrt(252) * (mean_return - risk_free_rate) / std
+            volatility = std * np.sqrt(252) * 100
+        
+        peak = portfolio_value[0]
+        max_drawdown = 0.0
+        for i in range(n):
+            peak = max(peak, portfolio_value[i])
+            max_drawdown = min(max_drawdown, (portfolio_value[i] - peak) / peak)
+        
+        metrics[p, 0] = (portfolio_value[-1] / initial_capital - 1) * 100
+        metrics[p, 1] = sharpe_ratio
+        metrics[p, 2] = max_drawdown * 100
+        metrics[p, 3] = len(trade_idx)
+        metrics[p, 4] = volatility
+        metrics[p, 5] = portfolio_value[-1]
+    
+    return metrics
 
 class BacktestingEngine:
     """Main backtesting engine class"""
@@ -54,15 +481,18 @@ class BacktestingEngine:
         self.end_date = end_date
         self.initial_capital = initial_capital
         self.data = None
-        self.trades = []
-        self.portfolio_value = []
+        self.trades_df = pd.DataFrame(columns=TRADE_COLUMNS)
+        self.trade_prices = np.empty(0)
+        self.trade_actions = np.empty(0, dtype=np.int8)
+        self.portfolio_value = None
         self.positions = []
         
-    def fetch_data(self):
+    def fetch_data(self, columns=None):
         """Fetch historical stock data"""
         try:
-            stock = yf.Ticker(self.ticker)
-            self.data = stock.history(start=self.start_date, end=self.end_date)
+            # A canonical key of plain strings, which Streamlit can hash and the disk cache can share
+            self.data = _load_price_history(*_cache_key(self.ticker, self.start_date, self.end_date),
+                                            list(columns) if columns is not None else None)
             return True
         except Exception as e:
             st.error(f"Error fetching data: {e}")
@@ -73,185 +503,124 @@ class BacktestingEngine:
         if self.data is None or self.data.empty:
             return False
         
-        # RSI
-        self.data['RSI'] = TechnicalIndicators.rsi(self.data['Close'])
-        
-        # MACD
-        macd, signal, histogram = TechnicalIndicators.macd(self.data['Close'])
-        self.data['MACD'] = macd
-        self.data['MACD_Signal'] = signal
-        self.data['MACD_Histogram'] = histogram
-        
-        # Moving Averages
-        self.data['MA_20'] = TechnicalIndicators.moving_average(self.data['Close'], 20)
-        self.data['MA_50'] = TechnicalIndicators.moving_average(self.data['Close'], 50)
-        
-        # Bollinger Bands
-        upper, middle, lower = TechnicalIndicators.bollinger_bands(self.data['Close'])
-        self.data['BB_Upper'] = upper
-        self.data['BB_Middle'] = middle
-        self.data['BB_Lower'] = lower
+        # Indicators depend only on the close prices, so changing strategy thresholds
+        # on a rerun reuses the cached arrays instead of recomputing them
+        indicators = _compute_indicators(self.data['Close'].to_numpy())
+        for column, values in indicators.items():
+            self.data[column] = values
         
         return True
     
+    def _signal_inputs(self):
+        """Return the SIGNAL_INPUTS columns as array views, without copying self.data"""
+        return {column: self.data[column].to_numpy(copy=False) for column in SIGNAL_INPUTS}
+    
     def generate_signals(self, strategy_params):
         """Generate buy/sell signals based on strategy parameters"""
-        self.data['Signal'] = 0
-        self.data['Position'] = 0
+        signal = _generate_signals(self._signal_inputs(), strategy_params)
+        self.data['Signal'] = signal
+        # Signals alternate starting from a buy, so their running sum is the position
+        self.data['Position'] = np.cumsum(signal, dtype=np.int8)
+    
+    def grid_search(self, param_grid):
+        """Backtest every strategy parameter set in param_grid, running the simulations in parallel"""
+        indicators = self._signal_inputs()
+        signal_matrix = np.empty((len(param_grid), len(self.data)), dtype=np.int8)
+        for p, strategy_params in enumerate(param_grid):
+            # Called uncached: hashing the inputs per set and filling the shared cache with
+            # one-off entries would cost more than it saves and evict the dashboard's entries
+            signal_matrix[p] = _build_signals(indicators, strategy_params)
         
-        for i in range(1, len(self.data)):
-            buy_condition = False
-            sell_condition = False
-            
-            # RSI conditions
-            if strategy_params['use_rsi']:
-                rsi_buy = self.data['RSI'].iloc[i] < strategy_params['rsi_buy_threshold']
-                rsi_sell = self.data['RSI'].iloc[i] > strategy_params['rsi_sell_threshold']
-            else:
-                rsi_buy = rsi_sell = False
-            
-            # MACD conditions
-            if strategy_params['use_macd']:
-                macd_crossover = (self.data['MACD'].iloc[i] > self.data['MACD_Signal'].iloc[i] and 
-                                self.data['MACD'].iloc[i-1] <= self.data['MACD_Signal'].iloc[i-1])
-                macd_crossunder = (self.data['MACD'].iloc[i] < self.data['MACD_Signal'].iloc[i] and 
-                                 self.data['MACD'].iloc[i-1] >= self.data['MACD_Signal'].iloc[i-1])
-            else:
-                macd_crossover = macd_crossunder = False
-            
-            # Moving Average conditions
-            if strategy_params['use_ma']:
-                ma_buy = self.data['Close'].iloc[i] > self.data['MA_20'].iloc[i]
-                ma_sell = self.data['Close'].iloc[i] < self.data['MA_20'].iloc[i]
-            else:
-                ma_buy = ma_sell = False
-            
-            # Combine conditions based on strategy logic
-            if strategy_params['logic'] == 'AND':
-                buy_condition = all([
-                    rsi_buy if strategy_params['use_rsi'] else True,
-                    macd_crossover if strategy_params['use_macd'] else True,
-                    ma_buy if strategy_params['use_ma'] else True
-                ])
-                sell_condition = any([
-                    rsi_sell if strategy_params['use_rsi'] else False,
-                    macd_crossunder if strategy_params['use_macd'] else False,
-                    ma_sell if strategy_params['use_ma'] else False
-                ])
-            else:  # OR logic
-                buy_condition = any([
-                    rsi_buy if strategy_params['use_rsi'] else False,
-                    macd_crossover if strategy_params['use_macd'] else False,
-                    ma_buy if strategy_params['use_ma'] else False
-                ])
-                sell_condition = any([
-                    rsi_sell if strategy_params['use_rsi'] else False,
-                    macd_crossunder if strategy_params['use_macd'] else False,
-                    ma_sell if strategy_params['use_ma'] else False
-                ])
-            
-            # Generate signals
-            current_position = self.data['Position'].iloc[i-1]
-            
-            if buy_condition and current_position == 0:
-                self.data.loc[self.data.index[i], 'Signal'] = 1  # Buy signal
-                self.data.loc[self.data.index[i], 'Position'] = 1
-            elif sell_condition and current_position == 1:
-                self.data.loc[self.data.index[i], 'Signal'] = -1  # Sell signal
-                self.data.loc[self.data.index[i], 'Position'] = 0
-            else:
-                self.data.loc[self.data.index[i], 'Position'] = current_position
+        metrics = _batch_simulate(self.data['Close'].to_numpy(copy=False), signal_matrix,
+                                  float(self.initial_capital))
+        
+        results = pd.DataFrame(param_grid)
+        results[GRID_METRICS] = metrics
+        results['Total Trades'] = results['Total Trades'].astype(int)
+        return results
     
     def simulate_trading(self):
         """Simulate trading based on generated signals"""
-        self.trades = []
-        cash = self.initial_capital
-        shares = 0
-        self.portfolio_value = []
+        dates = self.data.index
         
-        for i in range(len(self.data)):
-            current_price = self.data['Close'].iloc[i]
-            signal = self.data['Signal'].iloc[i]
-            
-            if signal == 1 and cash > 0:  # Buy
-                shares_to_buy = int(cash / current_price)
-                if shares_to_buy > 0:
-                    cost = shares_to_buy * current_price
-                    cash -= cost
-                    shares += shares_to_buy
-                    
-                    trade = {
-                        'Date': self.data.index[i],
-                        'Action': 'BUY',
-                        'Price': current_price,
-                        'Shares': shares_to_buy,
-                        'Cost': cost,
-                        'Cash': cash,
-                        'Total_Shares': shares
-                    }
-                    self.trades.append(trade)
-            
-            elif signal == -1 and shares > 0:  # Sell
-                revenue = shares * current_price
-                cash += revenue
-                
-                trade = {
-                    'Date': self.data.index[i],
-                    'Action': 'SELL',
-                    'Price': current_price,
-                    'Shares': shares,
-                    'Revenue': revenue,
-                    'Cash': cash,
-                    'Total_Shares': 0
-                }
-                self.trades.append(trade)
-                shares = 0
-            
-            # Calculate portfolio value
-            portfolio_val = cash + (shares * current_price)
-            self.portfolio_value.append(portfolio_val)
+        # Zero-copy views of the columns; the kernel widens prices to float64 per element
+        close = self.data['Close'].to_numpy(copy=False)
+        signals = self.data['Signal'].to_numpy(copy=False)
+        
+        # Without a buy signal nothing can trade, so the portfolio just holds its cash
+        if not (signals == 1).any():
+            self.trades_df = pd.DataFrame(columns=TRADE_COLUMNS)
+            self.trade_prices = np.empty(0)
+            self.trade_actions = np.empty(0, dtype=np.int8)
+            self.portfolio_value = np.full(len(close), float(self.initial_capital))
+            self.data['Portfolio_Value'] = self.portfolio_value
+            return
+        
+        (trade_idx, trade_action, trade_shares,
+         trade_value, trade_cash, trade_total_shares) = _simulate_trades(close, signals, self.initial_capital)
+        
+        # Cash and holdings only change on trade bars, so expand them as step functions
+        segment_lengths = np.diff(np.concatenate(([0], trade_idx, [len(close)])))
+        cash_arr = np.repeat(np.concatenate(([float(self.initial_capital)], trade_cash)), segment_lengths)
+        shares_arr = np.repeat(np.concatenate(([0], trade_total_shares)), segment_lengths)
+        portfolio_value = cash_arr + shares_arr * close
+        
+        # Parallel price/action arrays (1 = BUY, -1 = SELL) for vectorized trade statistics
+        self.trade_prices = close[trade_idx].astype(np.float64)
+        self.trade_actions = trade_action
         
-        self.data['Portfolio_Value'] = self.portfolio_value
+        # The kernel already returns one array per field, so the trade log is
+        # assembled column-wise only here, at the reporting boundary
+        is_buy = trade_action == 1
+        self.trades_df = pd.DataFrame({
+            'Date': dates[trade_idx],
+            'Action': np.where(is_buy, 'BUY', 'SELL'),
+            'Price': self.trade_prices,
+            'Shares': trade_shares,
+            'Cost': np.where(is_buy, trade_value, np.nan),
+            'Cash': trade_cash,
+            'Total_Shares': trade_total_shares,
+            'Revenue': np.where(is_buy, np.nan, trade_value)
+        })
+        
+        self.portfolio_value = portfolio_value
+        self.data['Portfolio_Value'] = portfolio_value
     
     def calculate_performance_metrics(self):
         """Calculate comprehensive performance metrics"""
-        if not self.portfolio_value:
+        if self.portfolio_value is None or len(self.portfolio_value) == 0:
             return {}
+        pv = self.portfolio_value
         
-        # Basic returns
-        returns = pd.Series(self.portfolio_value).pct_change().dropna()
-        cumulative_return = (self.portfolio_value[-1] / self.initial_capital - 1) * 100
+        # Basic returns, computed like pct_change but without building Series
+        returns = pv[1:] / pv[:-1] - 1
+        returns_std = returns.std(ddof=1)
+        cumulative_return = (pv[-1] / self.initial_capital - 1) * 100
         
-        # Win/Loss Ratio
-        winning_trades = [t for t in self.trades if t['Action'] == 'SELL']
-        if len(winning_trades) > 1:
-            trade_returns = []
-            for i in range(0, len(winning_trades), 2):
-                if i + 1 < len(winning_trades):
-                    buy_price = winning_trades[i]['Price'] if winning_trades[i]['Action'] == 'BUY' else winning_trades[i+1]['Price']
-                    sell_price = winning_trades[i+1]['Price'] if winning_trades[i+1]['Action'] == 'SELL' else winning_trades[i]['Price']
-                    trade_return = (sell_price - buy_price) / buy_price
-                    trade_returns.append(trade_return)
-            
-            wins = len([r for r in trade_returns if r > 0])
-            losses = len([r for r in trade_returns if r <= 0])
+        # Win/Loss Ratio over completed round trips; trades alternate BUY, SELL, ...
+        buy_prices = self.trade_prices[self.trade_actions == 1]
+        sell_prices = self.trade_prices[self.trade_actions == -1]
+        round_trips = min(len(buy_prices), len(sell_prices))
+        if round_trips > 0:
+            trade_returns = (sell_prices[:round_trips] - buy_prices[:round_trips]) / buy_prices[:round_trips]
+            wins = int((trade_returns > 0).sum())
+            losses = int((trade_returns <= 0).sum())
             win_loss_ratio = wins / losses if losses > 0 else float('inf')
         else:
             win_loss_ratio = 0
         
         # Sharpe Ratio (assuming risk-free rate of 2%)
         risk_free_rate = 0.02 / 252  # Daily risk-free rate
-        excess_returns = returns - risk_free_rate
-        sharpe_ratio = np.sqrt(252) * excess_returns.mean() / returns.std() if returns.std() != 0 else 0
+        sharpe_ratio = np.sqrt(252) * (returns.mean() - risk_free_rate) / returns_std if returns_std != 0 else 0
         
         # Maximum Drawdown
-        peak = np.maximum.accumulate(self.portfolio_value)
-        drawdown = (np.array(self.portfolio_value) - peak) / peak
-        max_drawdown = np.min(drawdown) * 100
+        peak = np.maximum.accumulate(pv)
+        drawdown = (pv - peak) / peak
+        max_drawdown = drawdown.min() * 100
         
         # Additional metrics
-        total_trades = len(self.trades)
-        volatility = returns.std() * np.sqrt(252) * 100
+        total_trades = len(self.trade_actions)
+        volatility = returns_std * np.sqrt(252) * 100
         
         return {
             'Cumulative Return (%)': round(cumulative_return, 2),
@@ -260,5 +629,24 @@ class BacktestingEngine:
             'Max Drawdown (%)': round(max_drawdown, 2),
             'Total Trades': total_trades,
             'Volatility (%)': round(volatility, 2),
-            'Final Portfolio Value': round(self.portfolio_value[-1], 2)
+            'Final Portfolio Value': round(pv[-1], 2)
         }
+
+def _run_one(ticker, start_date, end_date, strategy_params, initial_capital):
+    """Run a full backtest for one ticker and return its metrics and portfolio value series"""
+    engine = BacktestingEngine(ticker, start_date, end_date, initial_capital)
+    if not (engine.fetch_data() and engine.calculate_indicators()):
+        return {}, None
+    engine.generate_signals(strategy_params)
+    engine.simulate_trading()
+    return engine.calculate_performance_metrics(), engine.portfolio_value
+
+def run_many(tickers, start_date, end_date, strategy_params, initial_capital=100000, workers=None):
+    """Backtest the same strategy on several tickers in parallel worker processes"""
+    # One batched download up front; the workers then read their data from the Parquet cache
+    fetch_many(tickers, start_date, end_date)
+    
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = {executor.submit(_run_one, ticker, start_date, end_date, strategy_params, initial_capital): ticker
+                   for ticker in tickers}
+        return {futures[future]: future.result() for future in as_completed(futures)}